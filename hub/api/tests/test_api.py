@@ -13,6 +13,7 @@ from hub.util.exceptions import (
     DatasetHandlerError,
     UnsupportedCompressionError,
     InvalidTensorNameError,
+    TensorMetaInvalidHtypeOverwriteValue,
 )
 from hub.constants import MB
 
@@ -217,6 +218,20 @@ def test_empty_samples(ds: Dataset):
         np.testing.assert_array_equal(actual, expected)
 
 
+def test_append_after_read(memory_ds: Dataset):
+    tensor = memory_ds.create_tensor("image")
+    tensor.extend(np.zeros((3, 4), dtype="int64"))
+    before = tensor.numpy(aslist=True)
+
+    for i in range(100):
+        tensor.append(np.full(4, i))
+
+    assert_array_lists_equal(before, [np.zeros(4, dtype="int64")] * 3)
+    np.testing.assert_array_equal(
+        tensor[3:].numpy(), np.arange(100)[:, None].repeat(4, 1)
+    )
+
+
 @enabled_non_gcs_datasets
 def test_safe_downcasting(ds: Dataset):
     int_tensor = ds.create_tensor("int", dtype="uint8")
@@ -515,6 +530,86 @@ def test_dtype(memory_ds: Dataset):
     assert len(dtyped_tensor) == 1
 
 
+def test_ragged_shape_interval(memory_ds: Dataset):
+    tensor = memory_ds.create_tensor("tensor")
+    tensor.extend([np.ones((3, 5)), np.ones((4, 2)), np.ones((2, 4))])
+    assert tensor.meta.min_shape == [2, 2]
+    assert tensor.meta.max_shape == [4, 5]
+
+    tensor.extend([np.ones((1, 3)), np.ones((6, 4))])
+    assert tensor.meta.min_shape == [1, 2]
+    assert tensor.meta.max_shape == [6, 5]
+
+    with pytest.raises(TensorInvalidSampleShapeError):
+        tensor.extend([np.ones((2, 2, 2)), np.ones((3, 3, 3))])
+    assert tensor.meta.min_shape == [1, 2]
+    assert tensor.meta.max_shape == [6, 5]
+    assert len(tensor) == 5
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [
+        np.array(5, dtype="int32"),
+        np.zeros((0, 3), dtype="float32"),
+        np.arange(40, dtype="int64").reshape(4, 10)[:, ::3],
+    ],
+)
+def test_append_matches_extend(memory_ds: Dataset, sample):
+    appended = memory_ds.create_tensor("appended")
+    extended = memory_ds.create_tensor("extended")
+    appended.append(sample)
+    extended.extend([sample])
+
+    assert appended.shape == extended.shape
+    assert appended.dtype == extended.dtype
+    np.testing.assert_array_equal(appended.numpy(), extended.numpy())
+    np.testing.assert_array_equal(appended[0].numpy(), extended[0].numpy())
+
+
+def test_quantization(memory_ds: Dataset):
+    tensor = memory_ds.create_tensor(
+        "tensor", dtype="float32", quantization={"scale": 0.01, "zero_point": 128}
+    )
+    arr = np.random.uniform(-1, 1, (10, 28, 28)).astype("float32")
+    tensor.extend(arr)
+    tensor.append(np.full((28, 28), 5, dtype="float32"))  # saturates at 1.27
+
+    assert tensor.dtype == np.float32
+    assert tensor.meta.quantization == {"scale": 0.01, "zero_point": 128, "bits": 8}
+    np.testing.assert_allclose(tensor[:10].numpy(), arr, atol=0.005 + 1e-6)
+    np.testing.assert_allclose(tensor[10].numpy(), np.full((28, 28), 1.27), atol=1e-6)
+
+    with pytest.raises(TensorMetaInvalidHtypeOverwriteValue):
+        memory_ds.create_tensor("int_tensor", dtype="int32", quantization={"scale": 1})
+    with pytest.raises(TensorMetaInvalidHtypeOverwriteValue):
+        memory_ds.create_tensor(
+            "compressed_tensor",
+            dtype="float32",
+            sample_compression="lz4",
+            quantization={"scale": 1},
+        )
+
+
+def test_quantized_update(memory_ds: Dataset):
+    tensor = memory_ds.create_tensor(
+        "tensor", dtype="float32", quantization={"scale": 0.02, "zero_point": 100}
+    )
+    arr = np.random.uniform(-2, 2.5, (10, 4, 4)).astype("float32")
+    tensor.extend(arr)
+    # samples are stored as one byte per value
+    assert tensor.chunk_engine.last_chunk.num_data_bytes == arr.size
+
+    new_sample = np.random.uniform(-2, 2.5, (4, 4)).astype("float32")
+    tensor[4] = new_sample
+    arr[4] = new_sample
+
+    assert tensor.numpy().dtype == np.float32
+    np.testing.assert_allclose(tensor.numpy(), arr, atol=0.011)
+    np.testing.assert_allclose(tensor[4].numpy(), arr[4], atol=0.011)
+    np.testing.assert_allclose(tensor[1:9:3].numpy(), arr[1:9:3], atol=0.011)
+
+
 @pytest.mark.xfail(raises=TypeError, strict=True)
 def test_fails_on_wrong_tensor_syntax(memory_ds):
     memory_ds.some_tensor = np.ones((28, 28))
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from hub.constants import KB
 
 
@@ -99,3 +100,59 @@ def test_extend_and_append(memory_ds):
     _assert_num_chunks(images, 20)
 
     assert len(ds) == 400
+
+
+def _chunk_layout(tensor):
+    chunk_engine = tensor.chunk_engine
+    encoded = chunk_engine.chunk_id_encoder._encoded
+    byte_positions = [
+        chunk_engine.get_chunk_from_chunk_id(chunk_id).byte_positions_encoder._encoded
+        for chunk_id in encoded[:, 0]
+    ]
+    # chunk ids are random, so only the last sample index of each chunk is compared
+    return encoded[:, 1].tolist(), byte_positions
+
+
+@pytest.mark.parametrize(
+    "shape,num_existing_samples",
+    [
+        ((4, 8), 0),
+        # the space left below min_chunk_size is an exact multiple of the sample size
+        ((4, 8), 10),
+        ((6, 8), 10),
+        # the first incoming sample doesn't fit into the last chunk
+        ((6, 8), 341),
+    ],
+)
+def test_extend_uniform_and_ragged_layouts_match(
+    memory_ds, shape, num_existing_samples
+):
+    uniform = memory_ds.create_tensor("uniform", max_chunk_size=32 * KB)
+    ragged = memory_ds.create_tensor("ragged", max_chunk_size=32 * KB)
+
+    if num_existing_samples:
+        existing = np.ones((num_existing_samples, *shape), dtype=np.uint8)
+        uniform.extend(existing)
+        ragged.extend(existing)
+
+    arr = (np.arange(1500 * shape[0] * shape[1]) % 256).astype(np.uint8)
+    arr = arr.reshape(1500, *shape)
+    uniform.extend(arr)
+    # samples have the same number of bytes but alternating shapes, so the per-sample packing loop is used
+    ragged.extend(
+        [
+            sample if i % 2 else sample.reshape(shape[::-1])
+            for i, sample in enumerate(arr)
+        ]
+    )
+
+    assert uniform.chunk_engine.num_chunks == ragged.chunk_engine.num_chunks
+    assert uniform.chunk_engine.num_chunks > 1
+
+    uniform_last_seen, uniform_byte_positions = _chunk_layout(uniform)
+    ragged_last_seen, ragged_byte_positions = _chunk_layout(ragged)
+    assert uniform_last_seen == ragged_last_seen
+    for uniform_positions, ragged_positions in zip(
+        uniform_byte_positions, ragged_byte_positions
+    ):
+        np.testing.assert_array_equal(uniform_positions, ragged_positions)
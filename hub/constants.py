@@ -22,6 +22,9 @@ SUPPORTED_MODES = ["r", "a"]
 # min chunk size is always half of `DEFAULT_MAX_CHUNK_SIZE`
 DEFAULT_MAX_CHUNK_SIZE = 32 * MB
 
+# number of threads used by `LRUCache.flush` to write to storages with `parallel_writes` (ie. s3, gcs)
+MAX_FLUSH_WORKERS = 8
+
 MIN_FIRST_CACHE_SIZE = 32 * MB
 MIN_SECOND_CACHE_SIZE = 160 * MB
 
@@ -32,6 +35,11 @@ DEFAULT_LOCAL_CACHE_SIZE = 0
 # tensor containing hashes of samples
 HASHES_TENSOR_FOLDER = "_hashes"
 
+# algorithm used for new hashes tensors. the algorithm is stored in the hashes tensor's meta,
+# tensors without one were created with `LEGACY_HASH_ALGORITHM` and keep using it.
+HASH_ALGORITHM = "xxh3_64"
+LEGACY_HASH_ALGORITHM = "mmh3"
+
 # maximum allowable size before `large_ok` must be passed to dataset delete methods
 DELETE_SAFETY_SIZE = 1 * GB
 
@@ -44,6 +44,10 @@ class Chunk(Cachable):
                 All samples this chunk contains are added into `_data` in bytes form directly adjacent to one another, without
                 delimeters.
 
+                `_data` is backed by `_buffer`, which may be larger than the data it holds. Its capacity is doubled
+                (up to the max chunk size) whenever it runs out of room, so appending many small samples only
+                reallocates a logarithmic number of times.
+
             See `tobytes` and `frombytes` for more on how chunks are serialized
 
         Args:
@@ -56,11 +60,14 @@ class Chunk(Cachable):
 
         self.version = hub.__version__
 
+        # key of this chunk in storage, set by the `ChunkEngine` that loads or creates it
+        self.key: Optional[str] = None
+
         self.shapes_encoder = ShapeEncoder(encoded_shapes)
         self.byte_positions_encoder = BytePositionsEncoder(encoded_byte_positions)
 
         # May or may not be compressed.
-        self._data: Union[memoryview, bytearray] = data or bytearray()
+        self._data = data or bytearray()
 
         # These caches are only used when chunk-wise compression is specified.
         self._decompressed_samples_cache: Optional[List[np.ndarray]] = None
@@ -94,22 +101,59 @@ class Chunk(Cachable):
                 )
         return self._decompressed_data_cache
 
+    @property
+    def _data(self) -> Union[memoryview, bytearray, bytes]:
+        """The bytes held by this chunk, without any unused capacity at the end of `_buffer`."""
+        if self._num_data_bytes == len(self._buffer):
+            return self._buffer
+        return memoryview(self._buffer)[: self._num_data_bytes]
+
+    @_data.setter
+    def _data(self, data: Union[memoryview, bytearray, bytes]):
+        self._buffer = data
+        self._num_data_bytes = len(data)
+        # `bytes` and `memoryview` data may be shared with storage, so only a `bytearray` is written to in place.
+        self._owns_buffer = isinstance(data, bytearray)
+
     @property
     def memoryview_data(self):
-        if isinstance(self._data, memoryview):
-            return self._data
-        return memoryview(self._data)
+        data = self._data
+        if isinstance(data, memoryview):
+            return data
+        return memoryview(data)
+
+    def _append_data(self, buffer: memoryview, max_data_bytes: int):
+        """Writes `buffer` after the data already in this chunk, growing `_buffer` if it doesn't have enough room.
 
-    def _make_data_bytearray(self):
-        """Copies `self._data` into a bytearray if it is a memoryview."""
+        `_buffer` is never resized in place. When it is full, its contents are copied into a new `bytearray` with
+        double the capacity (capped at `max_data_bytes`). Arrays that were previously read from this chunk may still
+        reference the old buffer.
+        """
 
-        # `_data` will be a `memoryview` if `frombuffer` is called.
-        if isinstance(self._data, memoryview):
-            self._data = bytearray(self._data)
+        incoming_num_bytes = len(buffer)
+        start = self._num_data_bytes
+        end = start + incoming_num_bytes
+
+        current_buffer = self._buffer
+        if (
+            not self._owns_buffer
+            or not isinstance(current_buffer, bytearray)
+            or len(current_buffer) < end
+        ):
+            capacity = len(current_buffer)
+            if capacity < end:
+                capacity = max(end, min(2 * capacity, max_data_bytes))
+            current_buffer = bytearray(capacity)
+            current_buffer[:start] = self._data
+            self._buffer = current_buffer
+            self._owns_buffer = True
+
+        current_buffer[start:end] = buffer
+        self._num_data_bytes = end
 
     @property
     def num_data_bytes(self):
-        return len(self._data)
+        return self._num_data_bytes
 
     def is_under_min_space(self, min_data_bytes_target: int) -> bool:
         """If this chunk's data is less than `min_data_bytes_target`, returns True."""
@@ -145,13 +189,58 @@ class Chunk(Cachable):
             )
 
         ffw_chunk(self)
-        self._make_data_bytearray()
 
         # note: incoming_num_bytes can be 0 (empty sample)
-        self._data += buffer  # type: ignore
+        self._append_data(buffer, max_data_bytes)
+
+        # Consecutive samples with the same size and shape are registered to the headers as a single run.
+        num_samples = len(nbytes)
+        run_start = 0
+        for i in range(1, num_samples + 1):
+            if (
+                i == num_samples
+                or nbytes[i] != nbytes[run_start]
+                or shapes[i] != shapes[run_start]
+            ):
+                self.register_sample_to_headers(
+                    nbytes[run_start], shapes[run_start], i - run_start
+                )
+                run_start = i
 
-        for nb, shape in zip(nbytes, shapes):
-            self.register_sample_to_headers(nb, shape)
+    def extend_uniform_samples(
+        self,
+        buffer: memoryview,
+        max_data_bytes: int,
+        shape: Tuple[int],
+        num_samples: int,
+    ):
+        """Store `buffer` in this chunk as `num_samples` samples that all have the same shape and number of bytes.
+
+        Args:
+            buffer (memoryview): Buffer that represents `num_samples` samples of same shape and size.
+            max_data_bytes (int): Used to determine if this chunk has space for `buffer`.
+            shape (Tuple[int]): Shape of every sample.
+            num_samples (int): Number of samples in `buffer`.
+
+        Raises:
+            FullChunkError: If `buffer` is too large.
+        """
+        incoming_num_bytes = len(buffer)
+
+        if not self.has_space_for(incoming_num_bytes, max_data_bytes):
+            raise FullChunkError(
+                f"Chunk does not have space for the incoming bytes (incoming={incoming_num_bytes}, max={max_data_bytes})."
+            )
+
+        if num_samples == 0:
+            return
+
+        ffw_chunk(self)
+
+        self._append_data(buffer, max_data_bytes)
+        self.register_sample_to_headers(
+            incoming_num_bytes // num_samples, shape, num_samples
+        )
 
     def append_sample(self, buffer: memoryview, max_data_bytes: int, shape: Tuple[int]):
         """Store `buffer` in this chunk.
@@ -173,10 +262,9 @@ class Chunk(Cachable):
             )
 
         ffw_chunk(self)
-        self._make_data_bytearray()
 
         # note: incoming_num_bytes can be 0 (empty sample)
-        self._data += buffer  # type: ignore
+        self._append_data(buffer, max_data_bytes)
         self.register_sample_to_headers(incoming_num_bytes, shape)
 
     def _clear_decompressed_caches(self):
@@ -184,23 +272,26 @@ class Chunk(Cachable):
         self._decompressed_data_cache = None
 
     def register_sample_to_headers(
-        self, incoming_num_bytes: Optional[int], sample_shape: Tuple[int]
+        self,
+        incoming_num_bytes: Optional[int],
+        sample_shape: Tuple[int],
+        num_samples: int = 1,
     ):
-        """Registers a single sample to this chunk's header. A chunk should NOT exist without headers.
+        """Registers samples to this chunk's header. A chunk should NOT exist without headers.
 
         Args:
             incoming_num_bytes (int): The length of the buffer that was used to
             sample_shape (Tuple[int]): Every sample that `num_samples` symbolizes is considered to have `sample_shape`.
-
-        Raises:
-            ValueError: If `incoming_num_bytes` is not divisible by `num_samples`.
+            num_samples (int): Number of samples of `incoming_num_bytes` bytes each to register. Defaults to 1.
         """
 
-        self.shapes_encoder.register_samples(sample_shape, 1)
+        self.shapes_encoder.register_samples(sample_shape, num_samples)
         if (
             incoming_num_bytes is not None
         ):  # incoming_num_bytes is not applicable for image compressions
-            self.byte_positions_encoder.register_samples(incoming_num_bytes, 1)
+            self.byte_positions_encoder.register_samples(
+                incoming_num_bytes, num_samples
+            )
         self._clear_decompressed_caches()
 
     def update_sample(
@@ -289,7 +380,7 @@ class Chunk(Cachable):
             self.version,
             self.shapes_encoder.array,
             self.byte_positions_encoder.array,
-            len_data=len(self._data),
+            len_data=self._num_data_bytes,
         )
 
     def tobytes(self) -> memoryview:
@@ -1,15 +1,14 @@
 import hub
 import warnings
 import numpy as np
-from math import ceil
 from typing import Any, Dict, Optional, Sequence, Union, Tuple, List, Set
 
 from hub.compression import get_compression_type, BYTE_COMPRESSION, IMAGE_COMPRESSION
 from hub.core.version_control.commit_node import CommitNode  # type: ignore
 from hub.core.version_control.commit_chunk_set import CommitChunkSet  # type: ignore
 from hub.core.fast_forwarding import ffw_chunk_id_encoder
-from hub.core.compression import decompress_array
-from hub.core.sample import Sample, SampleValue  # type: ignore
+from hub.core.compression import decompress_array, decompress_batch
+from hub.core.sample import SampleValue  # type: ignore
 from hub.core.meta.tensor_meta import TensorMeta
 from hub.core.index.index import Index
 from hub.core.storage.lru_cache import LRUCache
@@ -17,6 +16,7 @@ from hub.core.chunk import Chunk
 from hub.core.meta.encode.chunk_id import ChunkIdEncoder
 from hub.core.serialize import serialize_input_samples
 from hub.core.compression import compress_multiple, decompress_multiple
+from hub.core.quantization import QUANTIZED_DTYPE, dequantize
 from hub.constants import DEFAULT_MAX_CHUNK_SIZE, FIRST_COMMIT_ID
 
 
@@ -30,26 +30,10 @@ from hub.util.exceptions import (
     CorruptedMetaError,
     DynamicTensorNumpyError,
 )
-from hub.util.casting import get_dtype, intelligent_cast
+from hub.util.casting import batch_of_one, get_dtype, intelligent_cast
 from hub.util.version_control import auto_checkout, commit, commit_chunk_set_exists
 
 
-def is_uniform_sequence(samples):
-    """Determines if a sequence of samples has uniform type and shape, allowing it to be vectorized by `ChunkEngine.extend`."""
-    if len(set(map(type, samples))) != 1:
-        # Cannot vectorize sequence with inconsistent types
-        return False
-    elif any(isinstance(s, np.ndarray) for s in samples):
-        # Numpy arrays will only be vectorized if they have the same shape
-        return len(set(s.shape for s in samples)) == 1
-    elif any(isinstance(s, Sample) for s in samples):
-        # Sample objects will not be vectorized
-        return False
-    else:
-        # Scalar samples can be vectorized
-        return True
-
-
 # used for warning the user if updating a tensor caused suboptimal chunks
 CHUNK_UPDATE_WARN_PORTION = 0.2
 
@@ -124,6 +108,11 @@ class ChunkEngine:
         self._meta_cache = meta_cache
         self.version_state = version_state
 
+        # tensor meta and chunk id encoder keys for the commit they were computed for (posixpath joins are slow)
+        self._keys_commit_id: Optional[str] = None
+        self._tensor_meta_key: Optional[str] = None
+        self._chunk_id_encoder_key: Optional[str] = None
+
         if self.tensor_meta.chunk_compression:
             # Cache samples in the last chunk in uncompressed form.
             self._last_chunk_uncompressed: List[np.ndarray] = (
@@ -151,6 +140,23 @@ class ChunkEngine:
     def meta_cache(self) -> LRUCache:
         return self._meta_cache or self.cache
 
+    def _refresh_keys(self):
+        commit_id = self.version_state["commit_id"]
+        if commit_id != self._keys_commit_id:
+            self._tensor_meta_key = get_tensor_meta_key(self.key, commit_id)
+            self._chunk_id_encoder_key = get_chunk_id_encoder_key(self.key, commit_id)
+            self._keys_commit_id = commit_id
+
+    @property
+    def tensor_meta_key(self) -> str:
+        self._refresh_keys()
+        return self._tensor_meta_key  # type: ignore
+
+    @property
+    def chunk_id_encoder_key(self) -> str:
+        self._refresh_keys()
+        return self._chunk_id_encoder_key  # type: ignore
+
     @property
     def chunk_id_encoder(self) -> ChunkIdEncoder:
         """Gets the chunk id encoder from cache, if one is not found it creates a blank encoder.
@@ -163,8 +169,7 @@ class ChunkEngine:
             ChunkIdEncoder: The chunk ID encoder handles the mapping between sample indices
                 and their corresponding chunks.
         """
-        commit_id = self.version_state["commit_id"]
-        key = get_chunk_id_encoder_key(self.key, commit_id)
+        key = self.chunk_id_encoder_key
         if not self.chunk_id_encoder_exists:
             enc = ChunkIdEncoder()
             self.meta_cache[key] = enc
@@ -200,9 +205,7 @@ class ChunkEngine:
     @property
     def chunk_id_encoder_exists(self) -> bool:
         try:
-            commit_id = self.version_state["commit_id"]
-            key = get_chunk_id_encoder_key(self.key, commit_id)
-            self.meta_cache[key]
+            self.meta_cache[self.chunk_id_encoder_key]
             return True
         except KeyError:
             return False
@@ -227,6 +230,7 @@ class ChunkEngine:
         chunk_commit_id = self.get_chunk_commit(chunk_name)
         chunk_key = get_chunk_key(self.key, chunk_name, chunk_commit_id)
         chunk = self.get_chunk(chunk_key)
+        chunk.key = chunk_key
         if chunk_commit_id != self.version_state["commit_id"]:
             chunk = self.copy_chunk_to_new_commit(chunk, chunk_name)
         return chunk
@@ -268,20 +272,32 @@ class ChunkEngine:
 
     @property
     def tensor_meta(self):
-        tensor_meta_key = get_tensor_meta_key(self.key, self.version_state["commit_id"])
-        return self.meta_cache.get_cachable(tensor_meta_key, TensorMeta)
+        return self.meta_cache.get_cachable(self.tensor_meta_key, TensorMeta)
 
     def _extend_bytes(
         self,
         buffer: memoryview,
         nbytes: List[int],
         shapes: List[Tuple[int]],
-    ):
-        """Treat `buffer` as multiple samples and place them into compressed `Chunk`s."""
+    ) -> List[str]:
+        """Treat `buffer` as multiple samples and place them into compressed `Chunk`s.
+
+        Args:
+            buffer (memoryview): Serialized samples, laid out back to back.
+            nbytes (List[int]): Number of bytes of each sample in `buffer`.
+            shapes (List[Tuple[int]]): Shape of each sample in `buffer`.
+
+        Returns:
+            List[str]: Keys of all chunks that were written to.
+        """
         if self.tensor_meta.chunk_compression:
             raise NotImplementedError(
-                "_extend_bytes not implemented for tensors with chunk wise compression. Use _append_bytes instead."
+                "_extend_bytes not implemented for tensors with chunk wise compression. Use _extend_bytes_to_compressed_chunks instead."
             )
+        max_chunk_size = self.max_chunk_size
+        min_chunk_size = self.min_chunk_size
+        enc = self.chunk_id_encoder
+
         num_samples = len(nbytes)
         chunk = self.last_chunk
         new_chunk = self._create_new_chunk
@@ -289,61 +305,143 @@ class ChunkEngine:
             chunk = new_chunk()
 
         # If the first incoming sample can't fit in the last chunk, create a new chunk.
-        if nbytes[0] > self.min_chunk_size - chunk.num_data_bytes:
-            chunk = self._create_new_chunk()
-
-        max_chunk_size = self.max_chunk_size
-        min_chunk_size = self.min_chunk_size
-        enc = self.chunk_id_encoder
+        if nbytes[0] > min_chunk_size - chunk.num_data_bytes:
+            chunk = new_chunk()
+        chunk_keys = [_chunk_key(chunk)]
+
+        # Samples are consumed by moving these cursors forward instead of re-slicing `buffer`, `nbytes` and `shapes`.
+        start = 0  # index of the first sample that hasn't been added to a chunk yet
+        offset = 0  # position of that sample in `buffer`
+        buffer_length = len(buffer)
+
+        # Batches coming from a single numpy array have the same size and shape for every sample. For those, the number
+        # of samples that go into each chunk can be computed directly and the chunk headers are written in one go.
+        uniform = (
+            nbytes.count(nbytes[0]) == num_samples
+            and shapes.count(shapes[0]) == num_samples
+        )
 
-        while nbytes:  # len(nbytes) is initially same as number of incoming samples.
-            num_samples_to_current_chunk = 0
-            nbytes_to_current_chunk = 0
-            for nb in nbytes:  # len(nbytes) = samples remaining to be added to a chunk
-
-                # Size of the current chunk if this sample is added to it
-                chunk_future_size = nbytes_to_current_chunk + nb + chunk.num_data_bytes  # type: ignore
-                if chunk_future_size > max_chunk_size:
-                    break
-
-                num_samples_to_current_chunk += 1
-                nbytes_to_current_chunk += nb
-                if (
-                    chunk_future_size > min_chunk_size
-                ):  # Try to keep chunk size close to min_chunk_size
-                    break
-            chunk.extend_samples(  # type: ignore
-                buffer[:nbytes_to_current_chunk],
-                max_chunk_size,
-                shapes[:num_samples_to_current_chunk],
-                nbytes[:num_samples_to_current_chunk],
-            )
+        while start < num_samples:
+            if uniform:
+                num_samples_to_current_chunk = self._num_uniform_samples_for_chunk(
+                    chunk.num_data_bytes, nbytes[0], num_samples - start  # type: ignore
+                )
+                nbytes_to_current_chunk = num_samples_to_current_chunk * nbytes[0]
+                chunk.extend_uniform_samples(  # type: ignore
+                    buffer[offset : offset + nbytes_to_current_chunk],
+                    max_chunk_size,
+                    shapes[0],
+                    num_samples_to_current_chunk,
+                )
+            else:
+                num_samples_to_current_chunk = 0
+                nbytes_to_current_chunk = 0
+                chunk_num_bytes = chunk.num_data_bytes  # type: ignore
+                for i in range(start, num_samples):
+                    nb = nbytes[i]
+
+                    # Size of the current chunk if this sample is added to it
+                    chunk_future_size = nbytes_to_current_chunk + nb + chunk_num_bytes
+                    if chunk_future_size > max_chunk_size:
+                        break
+
+                    num_samples_to_current_chunk += 1
+                    nbytes_to_current_chunk += nb
+                    if (
+                        chunk_future_size > min_chunk_size
+                    ):  # Try to keep chunk size close to min_chunk_size
+                        break
+                end = start + num_samples_to_current_chunk
+                chunk.extend_samples(  # type: ignore
+                    buffer[offset : offset + nbytes_to_current_chunk],
+                    max_chunk_size,
+                    shapes[start:end],
+                    nbytes[start:end],
+                )
             enc.register_samples(num_samples_to_current_chunk)
 
-            # Remove bytes from buffer that have been added to current chunk
-            buffer = buffer[nbytes_to_current_chunk:]
-
-            # Remove shapes and nbytes for samples that have beed added to current chunk
-            del nbytes[:num_samples_to_current_chunk]
-            del shapes[:num_samples_to_current_chunk]
+            start += num_samples_to_current_chunk
+            offset += nbytes_to_current_chunk
 
-            if buffer:
+            if offset < buffer_length:
                 chunk = new_chunk()
+                chunk_keys.append(_chunk_key(chunk))
+
+        return chunk_keys
+
+    def _num_uniform_samples_for_chunk(
+        self, chunk_num_bytes: int, sample_nbytes: int, num_samples: int
+    ) -> int:
+        """Number of samples of `sample_nbytes` bytes each that `_extend_bytes` would add to a chunk that already holds
+        `chunk_num_bytes` bytes, out of `num_samples` remaining samples."""
+        if sample_nbytes == 0:
+            return num_samples
+        # Samples are added while they fit under `max_chunk_size`, stopping after the first one that takes the chunk
+        # over `min_chunk_size`.
+        fits = (self.max_chunk_size - chunk_num_bytes) // sample_nbytes
+        until_min = max(1, (self.min_chunk_size - chunk_num_bytes) // sample_nbytes + 1)
+        return max(0, min(num_samples, fits, until_min))
+
+    def _extend_bytes_to_compressed_chunks(
+        self,
+        buffer: memoryview,
+        nbytes: List[int],
+        shapes: List[Tuple[int]],
+    ) -> List[str]:
+        """Treat `buffer` as multiple samples and place them one by one into compressed `Chunk`s.
+        Tensor meta, the chunk id encoder and the last chunk are only looked up once for the whole batch.
+
+        Args:
+            buffer (memoryview): Serialized samples, laid out back to back.
+            nbytes (List[int]): Number of bytes of each sample in `buffer`.
+            shapes (List[Tuple[int]]): Shape of each sample in `buffer`.
+
+        Returns:
+            List[str]: Keys of all chunks that were written to.
+        """
+        tensor_meta = self.tensor_meta
+        chunk_compression = tensor_meta.chunk_compression
+        dtype = tensor_meta.dtype
+        enc = self.chunk_id_encoder
 
-    def _append_bytes_to_compressed_chunk(self, buffer: memoryview, shape: Tuple[int]):
-        """Treat `buffer` as single sample and place them into compressed `Chunk`s."""
-        chunk_compression = self.tensor_meta.chunk_compression
+        last_chunk = self.last_chunk
+        chunk_keys = [] if last_chunk is None else [_chunk_key(last_chunk)]
+        offset = 0
+        for nb, shape in zip(nbytes, shapes):
+            chunk = self._append_bytes_to_compressed_chunk(
+                buffer[offset : offset + nb],
+                shape,
+                last_chunk,
+                chunk_compression,
+                dtype,
+            )
+            if chunk is not last_chunk:
+                chunk_keys.append(_chunk_key(chunk))
+                last_chunk = chunk
+            enc.register_samples(1)
+            offset += nb
+        return chunk_keys
+
+    def _append_bytes_to_compressed_chunk(
+        self,
+        buffer: memoryview,
+        shape: Tuple[int],
+        last_chunk: Optional[Chunk],
+        chunk_compression: str,
+        dtype: str,
+    ) -> Chunk:
+        """Treat `buffer` as single sample and place them into compressed `Chunk`s. Returns the chunk the sample was placed in."""
         last_chunk_uncompressed = self._last_chunk_uncompressed
 
         # Append incoming buffer to last chunk and compress:
         last_chunk_uncompressed.append(
-            np.frombuffer(buffer, dtype=self.tensor_meta.dtype).reshape(shape)
+            np.frombuffer(buffer, dtype=dtype).reshape(shape)
         )
         compressed_bytes = compress_multiple(last_chunk_uncompressed, chunk_compression)
 
         # Check if last chunk can hold new compressed buffer.
-        if self._can_set_to_last_chunk(len(compressed_bytes)):
-            chunk = self.last_chunk
+        if self._can_set_to_last_chunk(len(compressed_bytes), last_chunk):
+            chunk = last_chunk
         else:
             # Last chunk full, create new chunk
             chunk = self._create_new_chunk()
@@ -364,30 +462,10 @@ class ChunkEngine:
             # Byte positions are not relevant for image compressions, so incoming_num_bytes=None.
             chunk.register_sample_to_headers(incoming_num_bytes=None, sample_shape=shape)  # type: ignore
 
-    def _append_bytes(self, buffer: memoryview, shape: Tuple[int]):
-        """Treat `buffer` as a single sample and place them into `Chunk`s. This function implements the algorithm for
-        determining which chunks contain which parts of `buffer`.
-
-        Args:
-            buffer (memoryview): Buffer that represents a single sample. Can have a
-                length of 0, in which case `shape` should contain at least one 0 (empty sample).
-            shape (Tuple[int]): Shape for the sample that `buffer` represents.
-        """
-        # num samples is always 1 when appending
-        num_samples = 1
-
-        if self.tensor_meta.chunk_compression:
-            self._append_bytes_to_compressed_chunk(buffer, shape)
-        else:
-            buffer_consumed = self._try_appending_to_last_chunk(buffer, shape)
-            if not buffer_consumed:
-                self._append_to_new_chunk(buffer, shape)
+        return chunk  # type: ignore
 
-        self.chunk_id_encoder.register_samples(num_samples)
-
-    def _can_set_to_last_chunk(self, nbytes: int) -> bool:
+    def _can_set_to_last_chunk(self, nbytes: int, last_chunk: Optional[Chunk]) -> bool:
         """Whether last chunk's data can be set to a buffer of size nbytes."""
-        last_chunk = self.last_chunk
         if last_chunk is None:
             return False
         return nbytes <= self.min_chunk_size
@@ -400,7 +478,6 @@ class ChunkEngine:
         """
 
         # TODO implement tests for cache size compute
-        # TODO: optimize this by storing all of these keys in the chunk engine's state (posixpath.joins are pretty slow)
 
         # synchronize chunks
         if chunk_keys is None:
@@ -412,12 +489,10 @@ class ChunkEngine:
         commit_id = self.version_state["commit_id"]
 
         # synchronize tensor meta
-        tensor_meta_key = get_tensor_meta_key(self.key, commit_id)
-        self.meta_cache[tensor_meta_key] = self.tensor_meta
+        self.meta_cache[self.tensor_meta_key] = self.tensor_meta
 
         # synchronize chunk ID encoder
-        chunk_id_key = get_chunk_id_encoder_key(self.key, commit_id)
-        self.meta_cache[chunk_id_key] = self.chunk_id_encoder
+        self.meta_cache[self.chunk_id_encoder_key] = self.chunk_id_encoder
 
         # first commit doesn't have commit chunk set
         if commit_id != FIRST_COMMIT_ID:
@@ -425,73 +500,21 @@ class ChunkEngine:
             commit_chunk_set_key = get_tensor_commit_chunk_set_key(self.key, commit_id)
             self.meta_cache[commit_chunk_set_key] = self.commit_chunk_set  # type: ignore
 
-    def _try_appending_to_last_chunk(
-        self, buffer: memoryview, shape: Tuple[int]
-    ) -> bool:
-        """Will store `buffer` inside of the last chunk if it can.
-        It can be stored in the last chunk if it exists and has space for `buffer`.
-
-        Args:
-            buffer (memoryview): Data to store. This can represent any number of samples.
-            shape (Tuple[int]): Shape for the sample that `buffer` represents.
-
-        Returns:
-            bool: True if `buffer` was successfully written to the last chunk, otherwise False.
-        """
-
-        last_chunk = self.last_chunk
-        if last_chunk is None:
-            return False
-
-        incoming_num_bytes = len(buffer)
-
-        if last_chunk.is_under_min_space(self.min_chunk_size):
-            last_chunk_size = last_chunk.num_data_bytes
-            chunk_ct_content = _min_chunk_ct_for_data_size(
-                self.max_chunk_size, incoming_num_bytes
-            )
-
-            extra_bytes = min(incoming_num_bytes, self.max_chunk_size - last_chunk_size)
-            combined_chunk_ct = _min_chunk_ct_for_data_size(
-                self.max_chunk_size, incoming_num_bytes + last_chunk_size
-            )
-
-            # combine if count is same
-            if combined_chunk_ct == chunk_ct_content:
-                last_chunk.append_sample(
-                    buffer[:extra_bytes], self.max_chunk_size, shape
-                )
-                return True
-
-        return False
-
-    def _append_to_new_chunk(self, buffer: memoryview, shape: Tuple[int]):
-        """Will create a new chunk and store `buffer` inside of it. Assumes that `buffer`'s length is < max chunk size.
-        This should be called if `buffer` could not be added to the last chunk.
-
-        Args:
-            buffer (memoryview): Data to store. This can represent any number of samples.
-            shape (Tuple[int]): Shape for the sample that `buffer` represents.
-        """
-
-        # check if `last_chunk_extended` to handle empty samples
-        new_chunk = self._create_new_chunk()
-        new_chunk.append_sample(buffer, self.max_chunk_size, shape)
-
-    def _create_new_chunk(self):
+    def _create_new_chunk(self) -> Chunk:
         """Creates and returns a new `Chunk`. Automatically creates an ID for it and puts a reference in the cache."""
 
         chunk_id = self.chunk_id_encoder.generate_chunk_id()
         chunk = Chunk()
         chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
         chunk_key = get_chunk_key(self.key, chunk_name, self.version_state["commit_id"])
+        chunk.key = chunk_key
         if self.commit_chunk_set is not None:
             self.commit_chunk_set.add(chunk_name)
         self.cache[chunk_key] = chunk
         return chunk
 
     def extend(self, samples: Union[np.ndarray, Sequence[SampleValue]]):
-        """Formats a batch of `samples` and feeds them into `_append_bytes`."""
+        """Formats a batch of `samples` and feeds them into `_extend_bytes`."""
 
         self.cache.check_readonly()
         # if not the head node, checkout to an auto branch that is newly created
@@ -505,21 +528,18 @@ class ChunkEngine:
         buff, nbytes, shapes = serialize_input_samples(
             samples, tensor_meta, self.min_chunk_size
         )
-        for shape in shapes:
-            tensor_meta.update_shape_interval(shape)
+        tensor_meta.update_shape_interval_with_batch(shapes)
         tensor_meta.length += len(samples)
         if tensor_meta.chunk_compression:
-            for nb, shape in zip(nbytes, shapes):
-                self._append_bytes(buff[:nb], shape[:])  # type: ignore
-                buff = buff[nb:]
+            chunk_keys = self._extend_bytes_to_compressed_chunks(buff, nbytes, shapes)  # type: ignore
         else:
-            self._extend_bytes(buff, nbytes, shapes[:])  # type: ignore
-        self._synchronize_cache()
+            chunk_keys = self._extend_bytes(buff, nbytes, shapes)  # type: ignore
+        self._synchronize_cache(chunk_keys=chunk_keys)
         self.cache.maybe_flush()
 
     def append(self, sample: SampleValue):
-        """Formats a single `sample` (compresseses/decompresses if applicable) and feeds it into `_append_bytes`."""
-        self.extend([sample])
+        """Formats a single `sample` (compresseses/decompresses if applicable) and feeds it into `_extend_bytes`."""
+        self.extend(batch_of_one(sample))
 
     def update(
         self,
@@ -550,13 +570,13 @@ class ChunkEngine:
         chunks_nbytes_after_updates = []
         global_sample_indices = tuple(index.values[0].indices(self.num_samples))
         buffer, nbytes, shapes = serialized_input_samples
+        tensor_meta.update_shape_interval_with_batch(shapes)
         for i, (nb, shape) in enumerate(zip(nbytes, shapes)):
             global_sample_index = global_sample_indices[i]  # TODO!
             chunk = self.get_chunk_for_sample(global_sample_index, enc, copy=True)
             local_sample_index = enc.translate_index_relative_to_chunks(
                 global_sample_index
             )
-            tensor_meta.update_shape_interval(shape)
             chunk.update_sample(
                 local_sample_index,
                 buffer[:nb],  # type: ignore
@@ -568,12 +588,12 @@ class ChunkEngine:
             updated_chunks.add(chunk)
 
             # only care about deltas if it isn't the last chunk
-            if chunk.key != self.last_chunk_key:  # type: ignore
+            if chunk.key != self.last_chunk_key:
                 chunks_nbytes_after_updates.append(chunk.nbytes)
 
         # TODO: [refactor] this is a hacky way, also `self._synchronize_cache` might be redundant. maybe chunks should use callbacks.
         for chunk in updated_chunks:
-            self.cache[chunk.key] = chunk  # type: ignore
+            self.cache[_chunk_key(chunk)] = chunk
 
         self._synchronize_cache(chunk_keys=[])
         self.cache.maybe_flush()
@@ -620,20 +640,30 @@ class ChunkEngine:
         """
         length = self.num_samples
         enc = self.chunk_id_encoder
+        tensor_meta = self.tensor_meta
         last_shape = None
         samples = []
 
-        for global_sample_index in index.values[0].indices(length):
-            chunk = self.get_chunk_for_sample(global_sample_index, enc)
-            sample = self.read_sample_from_chunk(global_sample_index, chunk)
-            shape = sample.shape
+        global_sample_indices = np.fromiter(
+            index.values[0].indices(length), dtype=np.int64
+        )
+
+        # Each chunk is looked up once per run of indices that fall into it, rather than once per sample.
+        for chunk_id, local_sample_indices in enc.group_indices_by_chunk(
+            global_sample_indices
+        ):
+            chunk = self.get_chunk_from_chunk_id(chunk_id)
+            for sample in self._read_samples_from_chunk(
+                local_sample_indices, chunk, tensor_meta
+            ):
+                shape = sample.shape
 
-            if not aslist and last_shape is not None:
-                if shape != last_shape:
-                    raise DynamicTensorNumpyError(self.key, index, "shape")
+                if not aslist and last_shape is not None:
+                    if shape != last_shape:
+                        raise DynamicTensorNumpyError(self.key, index, "shape")
 
-            samples.append(sample)
-            last_shape = shape
+                samples.append(sample)
+                last_shape = shape
 
         return _format_read_samples(samples, index, aslist)
 
@@ -650,7 +680,17 @@ class ChunkEngine:
             Chunk: Chunk object that contains `global_sample_index`.
         """
 
-        chunk_id = enc[global_sample_index]
+        return self.get_chunk_from_chunk_id(enc[global_sample_index], copy=copy)
+
+    def get_chunk_from_chunk_id(self, chunk_id, copy: bool = False) -> Chunk:
+        """Retrives the `Chunk` object with id `chunk_id`.
+        Args:
+            chunk_id (ENCODING_DTYPE): Id of the chunk, as stored in the chunk id encoder.
+            copy (bool): If True and the chunk exists in a different commit to the current commit, it will be copied. Defaults to False.
+        Returns:
+            Chunk: Chunk object with id `chunk_id`.
+        """
+
         chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
         chunk_commit_id = self.get_chunk_commit(chunk_name)
         current_commit_id = self.version_state["commit_id"]
@@ -670,19 +710,86 @@ class ChunkEngine:
     ) -> np.ndarray:
         """Read a sample from a chunk, converts the global index into a local index. Handles decompressing if applicable."""
 
-        dtype = self.tensor_meta.dtype
-
         enc = self.chunk_id_encoder
+        local_sample_index = enc.translate_index_relative_to_chunks(global_sample_index)
+        return self._read_local_sample_from_chunk(
+            local_sample_index, chunk, self.tensor_meta, cast=cast, copy=copy
+        )
+
+    def _read_samples_from_chunk(
+        self,
+        local_sample_indices: np.ndarray,
+        chunk: Chunk,
+        tensor_meta: TensorMeta,
+    ) -> Union[np.ndarray, List[np.ndarray]]:
+        """Reads the samples at `local_sample_indices` (relative to `chunk`) from `chunk`.
+
+        If the tensor is uncompressed and all of the samples have the same shape, they are laid out back to back in the
+        chunk, so a single array is created over their bytes instead of one per sample. With sample compression, samples
+        of the same shape are decompressed together into one array.
+        """
+
+        buffer = chunk.memoryview_data
+        chunk_compression = tensor_meta.chunk_compression
+        sample_compression = tensor_meta.sample_compression
+        if not chunk_compression and len(buffer) > 0:
+            lo = int(local_sample_indices.min())
+            hi = int(local_sample_indices.max())
+            shapes_encoder = chunk.shapes_encoder
+            if shapes_encoder.translate_index(lo) == shapes_encoder.translate_index(hi):
+                shape = shapes_encoder[lo]
+                byte_positions_encoder = chunk.byte_positions_encoder
+                if sample_compression:
+                    # Samples are compressed one by one, but with a shared shape they can be decompressed into a
+                    # single preallocated array.
+                    buffers = []
+                    for i in local_sample_indices:
+                        sb, eb = byte_positions_encoder[i]
+                        buffers.append(buffer[sb:eb])
+                    return decompress_batch(
+                        buffers, shape, tensor_meta.dtype, sample_compression
+                    )
+                quantization = getattr(tensor_meta, "quantization", None)
+                sb, _ = byte_positions_encoder[lo]
+                _, eb = byte_positions_encoder[hi]
+                samples = np.frombuffer(
+                    buffer[sb:eb],
+                    dtype=QUANTIZED_DTYPE if quantization else tensor_meta.dtype,
+                )
+                samples = samples.reshape((hi - lo + 1, *shape))
+                if local_sample_indices[0] != lo or not np.all(
+                    np.diff(local_sample_indices) == 1
+                ):
+                    samples = samples[local_sample_indices - lo]
+                if quantization:
+                    samples = dequantize(samples, quantization, tensor_meta.dtype)
+                return samples
+
+        return [
+            self._read_local_sample_from_chunk(int(i), chunk, tensor_meta)
+            for i in local_sample_indices
+        ]
+
+    def _read_local_sample_from_chunk(
+        self,
+        local_sample_index: int,
+        chunk: Chunk,
+        tensor_meta: TensorMeta,
+        cast: bool = True,
+        copy: bool = False,
+    ) -> np.ndarray:
+        """Read the sample at `local_sample_index` (relative to `chunk`) from `chunk`. Handles decompressing if applicable."""
+
+        dtype = tensor_meta.dtype
 
         buffer = chunk.memoryview_data
 
-        local_sample_index = enc.translate_index_relative_to_chunks(global_sample_index)
         shape = chunk.shapes_encoder[local_sample_index]
 
         if len(buffer) == 0:
             return np.zeros(shape, dtype=dtype)
 
-        chunk_compression = self.tensor_meta.chunk_compression
+        chunk_compression = tensor_meta.chunk_compression
         if chunk_compression:
             if get_compression_type(chunk_compression) == BYTE_COMPRESSION:
                 decompressed = chunk.decompressed_data(compression=chunk_compression)
@@ -693,7 +800,7 @@ class ChunkEngine:
         sb, eb = chunk.byte_positions_encoder[local_sample_index]
         buffer = buffer[sb:eb]
 
-        sample_compression = self.tensor_meta.sample_compression
+        sample_compression = tensor_meta.sample_compression
         if sample_compression:
             sample = decompress_array(
                 buffer, shape, dtype=dtype, compression=sample_compression
@@ -701,6 +808,10 @@ class ChunkEngine:
             if cast and sample.dtype != dtype:
                 sample = sample.astype(dtype)
         else:
+            quantization = getattr(tensor_meta, "quantization", None)
+            if quantization:
+                sample = np.frombuffer(buffer, dtype=QUANTIZED_DTYPE).reshape(shape)
+                return dequantize(sample, quantization, dtype)
             if copy:
                 buffer = bytes(buffer)
             sample = np.frombuffer(buffer, dtype=dtype).reshape(shape)
@@ -755,9 +866,8 @@ class ChunkEngine:
             self.chunk_id_encoder.num_samples if self.chunk_id_encoder_exists else 0
         )
         if tensor_meta_length != chunk_id_num_samples:
-            commit_id = self.version_state["commit_id"]
-            tkey = get_tensor_meta_key(self.key, commit_id)
-            ikey = get_chunk_id_encoder_key(self.key, commit_id)
+            tkey = self.tensor_meta_key
+            ikey = self.chunk_id_encoder_key
             raise CorruptedMetaError(
                 f"'{tkey}' and '{ikey}' have a record of different numbers of samples. Got {tensor_meta_length} and {chunk_id_num_samples} respectively."
             )
@@ -796,9 +906,13 @@ def _format_read_samples(
         return np.array(samples)
 
 
-def _min_chunk_ct_for_data_size(chunk_max_data_bytes: int, size: int) -> int:
-    """Calculates the minimum number of chunks in which data of given size can be fit."""
-    return ceil(size / chunk_max_data_bytes)
+def _chunk_key(chunk: Chunk) -> str:
+    """Returns the storage key of a chunk that was loaded or created by a `ChunkEngine`."""
+    if chunk.key is None:
+        raise ValueError(
+            "Chunk has no key. Chunks get one when a `ChunkEngine` loads or creates them."
+        )
+    return chunk.key
 
 
 def _make_sequence(
@@ -172,7 +172,7 @@ def compress_array(array: np.ndarray, compression: str) -> bytes:
 
 def decompress_array(
     buffer: Union[bytes, memoryview, str],
-    shape: Optional[Tuple[int]] = None,
+    shape: Optional[Tuple[int, ...]] = None,
     dtype: Optional[str] = None,
     compression: Optional[str] = None,
 ) -> np.ndarray:
@@ -185,7 +185,7 @@ def decompress_array(
     Args:
         buffer (bytes, memoryview, str): Buffer or file to be decompressed. It is assumed all meta information required to
             decompress is contained within `buffer`, except for byte compressions
-        shape (Tuple[int], Optional): Desired shape of decompressed object. Reshape will attempt to match this shape before returning.
+        shape (Tuple[int, ...], Optional): Desired shape of decompressed object. Reshape will attempt to match this shape before returning.
         dtype (str, Optional): Applicable only for byte compressions. Expected dtype of decompressed array.
         compression (str, Optional): Applicable only for byte compressions. Compression used to compression the given buffer.
 
@@ -219,6 +219,48 @@ def decompress_array(
         raise SampleDecompressionError()
 
 
+def decompress_batch(
+    buffers: Sequence[Union[bytes, memoryview]],
+    shape: Tuple[int, ...],
+    dtype: str,
+    compression: str,
+) -> np.ndarray:
+    """Decompress multiple individually compressed samples that all have the same shape into a single array.
+
+    Args:
+        buffers (Sequence[Union[bytes, memoryview]]): Compressed samples, as produced by `compress_array`.
+        shape (Tuple[int, ...]): Shape of every sample.
+        dtype (str): Dtype of the returned array. Decompressed samples are cast to it if necessary.
+        compression (str): Compression used to compress each of the `buffers`.
+
+    Raises:
+        SampleDecompressionError: If decompression fails.
+
+    Returns:
+        np.ndarray: Array of shape `(len(buffers), *shape)`.
+    """
+    out = np.empty((len(buffers), *shape), dtype=dtype)
+    if compression == "lz4":
+        # lz4 can decompress directly into the output array, skipping an intermediate buffer per sample.
+        flat_out = out.reshape(len(buffers), -1)
+        for i, buffer in enumerate(buffers):
+            if buffer[:4] == b'\x04"M\x18':  # python-lz4 magic number
+                flat_out[i] = np.frombuffer(
+                    decompress_bytes(buffer, compression), dtype=dtype
+                )
+                continue
+            try:
+                numcodecs.lz4.decompress(buffer, dest=flat_out[i])
+            except Exception:
+                raise SampleDecompressionError()
+    else:
+        for i, buffer in enumerate(buffers):
+            out[i] = decompress_array(
+                buffer, shape, dtype=dtype, compression=compression
+            )
+    return out
+
+
 def _get_bounding_shape(shapes: Sequence[Tuple[int]]) -> Tuple[int, int, int]:
     """Gets the shape of a bounding box that can contain the given the shapes tiled horizontally."""
     if len(shapes) == 0:
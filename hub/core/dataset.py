@@ -281,7 +281,7 @@ class Dataset:
             dtype (str): Optionally override this tensor's `dtype`. All subsequent samples are required to have this `dtype`.
             sample_compression (str): All samples will be compressed in the provided format. If `None`, samples are uncompressed.
             chunk_compression (str): All chunks will be compressed in the provided format. If `None`, chunks are uncompressed.
-            hash_samples (Optional[bool]): If True, all samples added to this tensor will be hashed into two 64-bit integers
+            hash_samples (Optional[bool]): If True, all samples added to this tensor will be hashed into a 64-bit integer
                                         and stored in a hidden linked tensor.
             **kwargs: `htype` defaults can be overridden by passing any of the compatible parameters.
                 To see all `htype`s and their correspondent arguments, check out `hub/htypes.py`.
@@ -379,7 +379,7 @@ class Dataset:
             dtype (str): Optionally override this tensor's `dtype`. All subsequent samples are required to have this `dtype`.
             sample_compression (str): All samples will be compressed in the provided format. If `None`, samples are uncompressed.
             chunk_compression (str): All chunks will be compressed in the provided format. If `None`, chunks are uncompressed.
-            hash_samples (Optional[bool]): If True, all samples added to this tensor will be hashed into two 64-bit integers
+            hash_samples (Optional[bool]): If True, all samples added to this tensor will be hashed into a 64-bit integer
                                         and stored in a hidden linked tensor.
             **kwargs: `htype` defaults can be overridden by passing any of the compatible parameters.
                 To see all `htype`s and their correspondent arguments, check out `hub/htypes.py`.
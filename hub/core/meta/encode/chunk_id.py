@@ -5,6 +5,7 @@ import hub
 from hub.core.storage.cachable import Cachable
 import numpy as np
 from uuid import uuid4
+from typing import Iterator, Tuple
 from hub.core.serialize import serialize_chunkids, deserialize_chunkids
 
 
@@ -128,6 +129,51 @@ class ChunkIdEncoder(Encoder, Cachable):
 
         return int(global_sample_index - last_num_samples)
 
+    def group_indices_by_chunk(
+        self, global_sample_indices: np.ndarray
+    ) -> Iterator[Tuple[ENCODING_DTYPE, np.ndarray]]:
+        """Splits `global_sample_indices` into runs of consecutive indices that belong to the same chunk.
+        Rows are found with a single binary search over all indices instead of one per index.
+
+        Example:
+            Given: 2 sampes in chunk 0, 2 samples in chunk 1, and 3 samples in chunk 2.
+            >>> list(self.group_indices_by_chunk(np.array([1, 2, 3, 6, 0])))
+            [(id_0, array([1])), (id_1, array([0, 1])), (id_2, array([2])), (id_0, array([0]))]
+
+        Args:
+            global_sample_indices (np.ndarray): Indices of samples relative to the containing tensor.
+
+        Raises:
+            IndexError: If any of the indices is out of bounds for the samples registered to this encoder.
+
+        Yields:
+            Tuple[ENCODING_DTYPE, np.ndarray]: Chunk ID and the indices of the run relative to that chunk.
+        """
+
+        num_indices = len(global_sample_indices)
+        if num_indices == 0:
+            return
+
+        last_seen_indices = self._encoded[:, LAST_SEEN_INDEX_COLUMN]
+        row_indices = np.searchsorted(last_seen_indices, global_sample_indices)
+        if row_indices.max() >= len(self._encoded):
+            raise IndexError(
+                f"Index {global_sample_indices.max()} is out of bounds for {self.num_samples} samples."
+            )
+
+        run_starts = np.flatnonzero(np.diff(row_indices)) + 1
+        for start, end in zip(
+            [0, *run_starts.tolist()], [*run_starts.tolist(), num_indices]
+        ):
+            row_index = row_indices[start]
+            first_index = 0
+            if row_index > 0:
+                first_index = int(last_seen_indices[row_index - 1]) + 1
+            yield (
+                self._encoded[row_index, CHUNK_ID_COLUMN],
+                global_sample_indices[start:end] - first_index,
+            )
+
     def _validate_incoming_item(self, _, num_samples: int):
         if num_samples < 0:
             raise ValueError(
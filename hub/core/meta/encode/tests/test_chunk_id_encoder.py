@@ -1,6 +1,7 @@
 from hub.constants import ENCODING_DTYPE
 from hub.util.exceptions import ChunkIdEncoderError
 import pytest
+import numpy as np
 from hub.core.meta.encode.chunk_id import (
     ChunkIdEncoder,
 )
@@ -89,3 +90,28 @@ def test_ids():
     out_id = ChunkIdEncoder.id_from_name(name)
 
     assert id == out_id
+
+
+def test_group_indices_by_chunk():
+    enc = ChunkIdEncoder()
+
+    id1 = enc.generate_chunk_id()
+    enc.register_samples(2)
+    id2 = enc.generate_chunk_id()
+    enc.register_samples(2)
+    id3 = enc.generate_chunk_id()
+    enc.register_samples(3)
+
+    groups = list(enc.group_indices_by_chunk(np.array([1, 2, 3, 6, 0])))
+    assert [id for id, _ in groups] == [id1, id2, id3, id1]
+    assert [local.tolist() for _, local in groups] == [[1], [0, 1], [2], [0]]
+
+    for i in range(enc.num_samples):
+        ((id, local),) = enc.group_indices_by_chunk(np.array([i]))
+        assert id == enc[i]
+        assert local.tolist() == [enc.translate_index_relative_to_chunks(i)]
+
+    assert list(enc.group_indices_by_chunk(np.array([], dtype=np.int64))) == []
+
+    with pytest.raises(IndexError):
+        list(enc.group_indices_by_chunk(np.array([0, 7])))
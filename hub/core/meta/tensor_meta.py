@@ -1,6 +1,6 @@
 import hub
 from hub.core.fast_forwarding import ffw_tensor_meta
-from typing import Any, Callable, Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Optional
 import numpy as np
 from hub.util.exceptions import (
     TensorMetaInvalidHtype,
@@ -27,6 +27,7 @@ from hub.htype import (
 )
 from hub.htype import HTYPE_CONFIGURATIONS, REQUIRE_USER_SPECIFICATION, UNSPECIFIED
 from hub.core.meta.meta import Meta
+from hub.core.quantization import format_quantization, get_quantization_error
 
 
 class TensorMeta(Meta):
@@ -90,20 +91,40 @@ class TensorMeta(Meta):
         self.dtype = dtype.name
 
     def update_shape_interval(self, shape: Tuple[int, ...]):
+        self.update_shape_interval_with_batch([shape])
+
+    def update_shape_interval_with_batch(self, shapes: Sequence[Tuple[int, ...]]):
+        """Same as calling `update_shape_interval` for every shape in `shapes`, but the bounds are reduced
+        in a single pass instead of dimension by dimension for each sample.
+
+        Note:
+            All `shapes` are expected to have the same number of dimensions (`serialize_input_samples` ensures this).
+        """
+
+        if not shapes:
+            return
+
         ffw_tensor_meta(self)
 
+        first_shape = shapes[0]
+        if shapes.count(first_shape) == len(shapes):
+            # uniform batches (ie. numpy arrays) only have a single shape to account for
+            lower = upper = first_shape
+        else:
+            shapes_array = np.asarray(shapes, dtype=np.int64)
+            lower, upper = shapes_array.min(axis=0), shapes_array.max(axis=0)
+
         if not self.min_shape:  # both min_shape and max_shape are set together
-            self.min_shape = list(shape)
-            self.max_shape = list(shape)
+            self.min_shape = list(map(int, lower))
+            self.max_shape = list(map(int, upper))
         else:
             expected_dims = len(self.min_shape)
 
-            if len(shape) != expected_dims:
-                raise TensorInvalidSampleShapeError(shape, len(self.min_shape))
+            if len(first_shape) != expected_dims:
+                raise TensorInvalidSampleShapeError(first_shape, expected_dims)
 
-            for i, dim in enumerate(shape):
-                self.min_shape[i] = min(dim, self.min_shape[i])
-                self.max_shape[i] = max(dim, self.max_shape[i])
+            self.min_shape = np.minimum(self.min_shape, lower).tolist()
+            self.max_shape = np.maximum(self.max_shape, upper).tolist()
 
     def __getstate__(self) -> Dict[str, Any]:
         d = super().__getstate__()
@@ -219,6 +240,18 @@ def _validate_required_htype_overwrites(htype_overwrite: dict):
             "Datatype must be supported by numpy. Can be an `str`, `np.dtype`, or normal python type (like `bool`, `float`, `int`, etc.). List of available numpy dtypes found here: https://numpy.org/doc/stable/user/basics.types.html",
         )
 
+    quantization = htype_overwrite.get("quantization")
+    if quantization is not None:
+        error = get_quantization_error(
+            quantization,
+            htype_overwrite["dtype"],
+            compressed=bool(sample_compression or chunk_compression),
+        )
+        if error:
+            raise TensorMetaInvalidHtypeOverwriteValue(
+                "quantization", quantization, error
+            )
+
 
 def _format_values(htype_overwrite: dict):
     """Replaces values in `htype_overwrite` with consistent types/formats."""
@@ -226,6 +259,11 @@ def _format_values(htype_overwrite: dict):
     if htype_overwrite["dtype"] is not None:
         htype_overwrite["dtype"] = np.dtype(htype_overwrite["dtype"]).name
 
+    if htype_overwrite.get("quantization") is not None:
+        htype_overwrite["quantization"] = format_quantization(
+            htype_overwrite["quantization"]
+        )
+
     for key, value in COMPRESSION_ALIASES.items():
         if htype_overwrite.get("sample_compression") == key:
             htype_overwrite["sample_compression"] = value
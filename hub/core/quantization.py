@@ -0,0 +1,95 @@
+from typing import Any, Dict, Optional, Union
+import numpy as np
+
+
+# dtype that quantized samples are stored as inside of chunks
+QUANTIZED_DTYPE = np.dtype("uint8")
+QUANTIZATION_BITS = 8
+
+
+def get_quantization_error(
+    quantization: Any, dtype: Optional[str], compressed: bool
+) -> Optional[str]:
+    """Checks that a `quantization` tensor meta value can be used with a tensor.
+
+    Args:
+        quantization (Any): Value to check. Expected to look like `{"scale": 0.1, "zero_point": 128}`.
+        dtype (str, optional): The tensor's dtype.
+        compressed (bool): Whether the tensor has sample or chunk compression.
+
+    Returns:
+        None if `quantization` is valid, otherwise an explanation of why it isn't.
+    """
+
+    if not isinstance(quantization, dict):
+        return 'Quantization must be a dictionary like `{"scale": 0.1, "zero_point": 128}`.'
+
+    unexpected_keys = set(quantization) - {"scale", "zero_point", "bits"}
+    if unexpected_keys:
+        return f"Unexpected quantization keys: {sorted(unexpected_keys)}."
+
+    scale = quantization.get("scale")
+    if (
+        isinstance(scale, bool)
+        or not isinstance(scale, (int, float, np.integer, np.floating))
+        or scale <= 0
+    ):
+        return "Quantization `scale` must be a positive number."
+
+    zero_point = quantization.get("zero_point", 0)
+    if (
+        isinstance(zero_point, bool)
+        or not isinstance(zero_point, (int, np.integer))
+        or not 0 <= zero_point <= np.iinfo(QUANTIZED_DTYPE).max
+    ):
+        return f"Quantization `zero_point` must be an integer in [0, {np.iinfo(QUANTIZED_DTYPE).max}]."
+
+    if quantization.get("bits", QUANTIZATION_BITS) != QUANTIZATION_BITS:
+        return f"Only {QUANTIZATION_BITS} bit quantization is supported."
+
+    if dtype is None or np.dtype(dtype).kind != "f":
+        return "Quantization requires the tensor `dtype` to be explicitly set to a float dtype."
+
+    if compressed:
+        return "Quantization is only supported for tensors without sample or chunk compression."
+
+    return None
+
+
+def format_quantization(quantization: Dict) -> Dict:
+    """Returns `quantization` with all keys populated and json friendly types."""
+
+    return {
+        "scale": float(quantization["scale"]),
+        "zero_point": int(quantization.get("zero_point", 0)),
+        "bits": QUANTIZATION_BITS,
+    }
+
+
+def quantize(array: np.ndarray, quantization: Dict) -> np.ndarray:
+    """Maps float values to `QUANTIZED_DTYPE` as `round(array / scale + zero_point)`, saturating at the dtype's bounds."""
+
+    info = np.iinfo(QUANTIZED_DTYPE)
+    quantized = np.divide(
+        array, quantization["scale"], dtype=_computation_dtype(array.dtype)
+    )
+    quantized += quantization["zero_point"]
+    np.rint(quantized, out=quantized)
+    np.clip(quantized, info.min, info.max, out=quantized)
+    return quantized.astype(QUANTIZED_DTYPE)
+
+
+def dequantize(
+    array: np.ndarray, quantization: Dict, dtype: Union[str, np.dtype]
+) -> np.ndarray:
+    """Inverse of `quantize`: maps `QUANTIZED_DTYPE` values back to `dtype` as `(array - zero_point) * scale`."""
+
+    dequantized = array.astype(_computation_dtype(dtype))
+    dequantized -= quantization["zero_point"]
+    dequantized *= quantization["scale"]
+    return dequantized.astype(dtype, copy=False)
+
+
+def _computation_dtype(dtype: Union[str, np.dtype]) -> np.dtype:
+    """Half precision can't represent `array / scale + zero_point` accurately, so it is computed in at least float32."""
+    return np.promote_types(dtype, np.float32)
@@ -1,8 +1,9 @@
 from hub.core.meta.tensor_meta import TensorMeta
 from hub.util.exceptions import TensorInvalidSampleShapeError
-from hub.util.casting import intelligent_cast
+from hub.util.casting import intelligent_cast, is_sequence
 from hub.core.sample import Sample, SampleValue  # type: ignore
 from hub.core.compression import compress_array
+from hub.core.quantization import quantize
 from hub.client import config
 from hub.compression import IMAGE_COMPRESSIONS
 from typing import List, Optional, Sequence, Union, Tuple, Iterable
@@ -225,12 +226,17 @@ def deserialize_chunkids(byts: Union[bytes, memoryview]) -> Tuple[str, np.ndarra
     return version, ids
 
 
+def byte_view(array: np.ndarray) -> memoryview:
+    """Returns a flat uint8 memoryview over `array`. Only copies if `array` is not C-contiguous."""
+    return np.ascontiguousarray(array).reshape(-1).view(np.uint8).data
+
+
 def _serialize_input_sample(
     sample: SampleValue,
     sample_compression: Optional[str],
     expected_dtype: np.dtype,
     htype: str,
-) -> Tuple[bytes, Tuple[int]]:
+) -> Tuple[Union[bytes, memoryview], Tuple[int]]:
     """Converts the incoming sample into a buffer with the proper dtype and compression."""
 
     if isinstance(sample, Sample):
@@ -250,7 +256,8 @@ def _serialize_input_sample(
         if sample_compression is not None:
             buffer = compress_array(sample, sample_compression)
         else:
-            buffer = sample.tobytes()
+            # the caller copies the buffer into its own storage, so there is no need for `tobytes`
+            buffer = byte_view(sample)
 
     if len(shape) == 0:
         shape = (1,)
@@ -258,35 +265,30 @@ def _serialize_input_sample(
     return buffer, shape
 
 
-def _check_input_samples_are_valid(
-    num_bytes: List[int],
-    shapes: List[Tuple[int]],
+def _check_input_sample_is_valid(
+    nbytes: int,
+    shape: Tuple[int],
+    expected_dimensionality: int,
     min_chunk_size: int,
     sample_compression: Optional[str],
 ):
-    """Iterates through all buffers/shapes and raises appropriate errors."""
-
-    expected_dimensionality = None
-    for nbytes, shape in zip(num_bytes, shapes):
-        # check that all samples have the same dimensionality
-        if expected_dimensionality is None:
-            expected_dimensionality = len(shape)
+    """Raises appropriate errors if a single serialized sample is invalid."""
 
-        if nbytes > min_chunk_size:
-            msg = f"Sorry, samples that exceed minimum chunk size ({min_chunk_size} bytes) are not supported yet (coming soon!). Got: {nbytes} bytes."
-            if sample_compression is None:
-                msg += "\nYour data is uncompressed, so setting `sample_compression` in `Dataset.create_tensor` could help here!"
-            raise NotImplementedError(msg)
+    if nbytes > min_chunk_size:
+        msg = f"Sorry, samples that exceed minimum chunk size ({min_chunk_size} bytes) are not supported yet (coming soon!). Got: {nbytes} bytes."
+        if sample_compression is None:
+            msg += "\nYour data is uncompressed, so setting `sample_compression` in `Dataset.create_tensor` could help here!"
+        raise NotImplementedError(msg)
 
-        if len(shape) != expected_dimensionality:
-            raise TensorInvalidSampleShapeError(shape, expected_dimensionality)
+    if len(shape) != expected_dimensionality:
+        raise TensorInvalidSampleShapeError(shape, expected_dimensionality)
 
 
 def serialize_input_samples(
     samples: Union[Sequence[SampleValue], np.ndarray],
     meta: TensorMeta,
     min_chunk_size: int,
-) -> Tuple[Union[memoryview, bytearray], List[int], List[Tuple[int]]]:
+) -> Tuple[memoryview, List[int], List[Tuple[int]]]:
     """Casts, compresses, and serializes the incoming samples into a list of buffers and shapes.
 
     Args:
@@ -308,21 +310,29 @@ def serialize_input_samples(
 
     sample_compression = meta.sample_compression
     dtype = np.dtype(meta.dtype)
+    quantization = getattr(meta, "quantization", None)
     htype = meta.htype
 
+    buff: memoryview
     if sample_compression or not hasattr(samples, "dtype"):
-        buff = bytearray()
+        serialized = bytearray()
         nbytes = []
         shapes = []
         expected_dim = len(meta.max_shape)
         is_convert_candidate = (htype == "image") or (
             sample_compression in IMAGE_COMPRESSIONS
         )
+        expected_dimensionality = None
 
+        # samples are validated as they are serialized, so an invalid sample fails before the rest are compressed
         for sample in samples:
             byts, shape = _serialize_input_sample(
                 sample, sample_compression, dtype, htype
             )
+            if quantization:
+                byts = byte_view(
+                    quantize(np.frombuffer(byts, dtype=dtype), quantization)
+                )
             if (
                 isinstance(sample, Sample)
                 and sample._convert_grayscale
@@ -335,26 +345,48 @@ def serialize_input_samples(
                         f"Reshaping grayscale image with shape {shape} to {shape + (1,)} to match tensor dimension."
                     )
                     shape += (1,)  # type: ignore[assignment]
-            buff += byts
+            if expected_dimensionality is None:
+                expected_dimensionality = len(shape)
+            _check_input_sample_is_valid(
+                len(byts),
+                shape,
+                expected_dimensionality,
+                min_chunk_size,
+                sample_compression,
+            )
+            serialized += byts
             nbytes.append(len(byts))
             shapes.append(shape)
+        # slicing a memoryview doesn't copy, so each sample is only copied once more when it is written to its chunk
+        buff = memoryview(serialized)
     elif (
-        isinstance(samples, np.ndarray)
-        or np.isscalar(samples)
-        or isinstance(samples, Sequence)
+        isinstance(samples, np.ndarray) or np.isscalar(samples) or is_sequence(samples)
     ):
         samples = intelligent_cast(samples, dtype, htype)
-        buff = memoryview(samples.tobytes())  # type: ignore
-        if len(samples):
+        if quantization:
+            samples = quantize(samples, quantization)
+        if meta.chunk_compression:
+            # Chunk-wise compression keeps the incoming samples around in `ChunkEngine._last_chunk_uncompressed`,
+            # so they must not alias the caller's array.
+            buff = memoryview(samples.tobytes())  # type: ignore
+        else:
+            # Bytes are copied into the chunk right away, so a zero-copy view over the (contiguous) samples is enough.
+            buff = byte_view(samples)
+        num_samples = len(samples)
+        if num_samples:
             shape = samples[0].shape
             nb = samples[0].nbytes
             if not shape:
                 shape = (1,)
+            # every sample has the same size and shape, so validating one of them covers the whole batch
+            _check_input_sample_is_valid(
+                nb, shape, len(shape), min_chunk_size, sample_compression
+            )
         else:
             shape = ()  # type: ignore
             nb = 0
-        nbytes = [nb] * len(samples)
-        shapes = [shape] * len(samples)
+        nbytes = [nb] * num_samples
+        shapes = [shape] * num_samples
     elif isinstance(samples, Sample):
         # TODO
         raise NotImplementedError(
@@ -362,5 +394,4 @@ def serialize_input_samples(
         )
     else:
         raise TypeError(f"Cannot serialize samples of type {type(samples)}")
-    _check_input_samples_are_valid(nbytes, shapes, min_chunk_size, sample_compression)
     return buff, nbytes, shapes
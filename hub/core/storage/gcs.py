@@ -187,6 +187,8 @@ class GCloudCredentials:
 class GCSProvider(StorageProvider):
     """Provider class for using GC storage."""
 
+    parallel_writes = True
+
     def __init__(self, root: str, token: Union[str, Dict] = None, project: str = None):
         """Initializes the GCSProvider
 
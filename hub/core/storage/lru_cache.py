@@ -1,4 +1,6 @@
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hub.constants import MAX_FLUSH_WORKERS
 from hub.core.storage.cachable import Cachable, CachableCallback
 from typing import Any, Dict, Optional, Set, Union
 
@@ -55,11 +57,24 @@ class LRUCache(StorageProvider):
     def flush(self):
         """Writes data from cache_storage to next_storage. Only the dirty keys are written.
         This is a cascading function and leads to data being written to the final storage in case of a chained cache.
+        If next_storage supports `parallel_writes` (ie. s3, gcs), the dirty keys are written concurrently.
         """
         self.check_readonly()
         if self.dirty_keys:
-            for key in self.dirty_keys.copy():
-                self._forward(key)
+            dirty_keys = list(self.dirty_keys)
+            if (
+                len(dirty_keys) > 1
+                and self.next_storage is not None
+                and self.next_storage.parallel_writes
+            ):
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_FLUSH_WORKERS, len(dirty_keys))
+                ) as executor:
+                    # consuming the results re-raises the first failed write
+                    list(executor.map(self._forward, dirty_keys))
+            else:
+                for key in dirty_keys:
+                    self._forward(key)
             if self.next_storage is not None:
                 self.next_storage.flush()
 
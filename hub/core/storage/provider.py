@@ -12,6 +12,8 @@ class StorageProvider(ABC, MutableMapping):
 
     autoflush = False
     read_only = False
+    # if True, caches may write multiple keys to the provider concurrently
+    parallel_writes = False
 
     """An abstract base class for implementing a storage provider.
 
@@ -1,4 +1,5 @@
 import time
+import threading
 import boto3
 import botocore  # type: ignore
 import posixpath
@@ -13,6 +14,8 @@ import hub
 class S3Provider(StorageProvider):
     """Provider class for using S3 storage."""
 
+    parallel_writes = True
+
     def __init__(
         self,
         root: str,
@@ -236,6 +239,9 @@ class S3Provider(StorageProvider):
     def _initialize_s3_parameters(self):
         self._set_bucket_and_path()
 
+        # `LRUCache.flush` writes to s3 from multiple threads, only one of them should refresh the credentials
+        self._creds_lock = threading.Lock()
+
         self.client_config = botocore.config.Config(
             max_pool_connections=self.max_pool_connections,
         )
@@ -249,7 +255,14 @@ class S3Provider(StorageProvider):
         """If the client has an expiration time, check if creds are expired and fetch new ones.
         This would only happen for datasets stored on Hub storage for which temporary 12 hour credentials are generated.
         """
-        if self.expiration and float(self.expiration) < time.time():
+        if not self._creds_expired():
+            return
+
+        with self._creds_lock:
+            # another thread may have refreshed the credentials while this one was waiting for the lock
+            if not self._creds_expired():
+                return
+
             client = HubBackendClient(self.token)
             org_id, ds_name = self.tag.split("/")
 
@@ -258,12 +271,16 @@ class S3Provider(StorageProvider):
             url, creds, mode, expiration = client.get_dataset_credentials(
                 org_id, ds_name, mode
             )
-            self.expiration = expiration
             self._set_s3_client_and_resource(
                 creds.get("aws_access_key_id"),
                 creds.get("aws_secret_access_key"),
                 creds.get("aws_session_token"),
             )
+            # only marked as refreshed once the new client is in place
+            self.expiration = expiration
+
+    def _creds_expired(self) -> bool:
+        return bool(self.expiration and float(self.expiration) < time.time())
 
     def _locate_and_load_creds(self):
         session = boto3._get_default_session()._session
@@ -3,11 +3,14 @@ from hub.tests.path_fixtures import gcs_creds
 from hub.tests.storage_fixtures import enabled_storages, enabled_persistent_storages
 from hub.tests.cache_fixtures import enabled_cache_chains
 from hub.core.storage.gcs import GCloudCredentials
+from hub.core.storage import LRUCache, MemoryProvider
 from hub.util.exceptions import GCSDefaultCredsNotFoundError
 import os
 import pytest
 from hub.constants import MB
 import pickle
+import threading
+import time
 
 
 KEY = "file"
@@ -139,6 +142,55 @@ def test_pickling(storage):
     assert unpickled_storage[FILE_1] == b"hello world"
 
 
+class SlowMemoryProvider(MemoryProvider):
+    """Memory provider with slow writes that records how many of them were in progress at once."""
+
+    parallel_writes = True
+
+    def __init__(self, root, fail_path=None):
+        super().__init__(root)
+        self.fail_path = fail_path
+        self.active_writes = 0
+        self.max_active_writes = 0
+        self.lock = threading.Lock()
+
+    def __setitem__(self, path, value):
+        with self.lock:
+            self.active_writes += 1
+            self.max_active_writes = max(self.max_active_writes, self.active_writes)
+        try:
+            time.sleep(0.01)
+            if path == self.fail_path:
+                raise ValueError(f"Failed to write {path}")
+            super().__setitem__(path, value)
+        finally:
+            with self.lock:
+                self.active_writes -= 1
+
+
+def test_parallel_flush():
+    storage = SlowMemoryProvider("mem://parallel")
+    cache = LRUCache(MemoryProvider("mem://cache"), storage, 32 * MB)
+
+    for i in range(50):
+        cache[f"{KEY}_{i}"] = bytes([i]) * 100
+    cache.flush()
+
+    assert storage.max_active_writes > 1
+    assert not cache.dirty_keys
+    assert len(storage) == 50
+    for i in range(50):
+        assert storage[f"{KEY}_{i}"] == bytes([i]) * 100
+
+    # a failed write is raised from `flush`
+    failing_storage = SlowMemoryProvider("mem://failing", fail_path=f"{KEY}_7")
+    cache = LRUCache(MemoryProvider("mem://cache"), failing_storage, 32 * MB)
+    for i in range(50):
+        cache[f"{KEY}_{i}"] = bytes([i]) * 100
+    with pytest.raises(ValueError, match=f"{KEY}_7"):
+        cache.flush()
+
+
 def test_gcs_tokens():
     gcreds = GCloudCredentials()
     assert gcreds.credentials
@@ -10,9 +10,9 @@ from hub.core.chunk_engine import ChunkEngine
 from hub.api.info import load_info
 from hub.util.keys import get_tensor_meta_key, tensor_exists, get_tensor_info_key
 from hub.constants import HASHES_TENSOR_FOLDER
-from hub.util.casting import get_incompatible_dtype, intelligent_cast
+from hub.util.casting import batch_of_one, get_incompatible_dtype, intelligent_cast
 from hub.util.shape_interval import ShapeInterval
-from hub.util.hash import generate_hashes
+from hub.util.hash import generate_hashes, get_hash_algorithm
 from hub.util.exceptions import (
     TensorDoesNotExistError,
     InvalidKeyTypeError,
@@ -198,7 +198,9 @@ class Tensor:
         self.chunk_engine.extend(samples)
 
         if HASHES_TENSOR_FOLDER in self.meta.linked_tensors:
-            hashed_samples = generate_hashes(samples)
+            hashed_samples = generate_hashes(
+                samples, get_hash_algorithm(self.linked_tensor.meta)
+            )
             self.linked_tensor.chunk_engine.extend(hashed_samples)
 
     def append(
@@ -226,7 +228,7 @@ class Tensor:
         Args:
             sample (np.ndarray, float, int, Sample): The data to append to the tensor. `Sample` is generated by `hub.read`. See the above examples.
         """
-        self.extend([sample])
+        self.extend(batch_of_one(sample))
 
     @property
     def meta(self):
@@ -385,7 +387,9 @@ class Tensor:
         self.chunk_engine.update(self.index[item_index], value)
 
         if HASHES_TENSOR_FOLDER in self.meta.linked_tensors:
-            hashed_samples = generate_hashes(value)
+            hashed_samples = generate_hashes(
+                value, get_hash_algorithm(self.linked_tensor.meta)
+            )
             self.linked_tensor.chunk_engine.update(
                 self.index[item_index], hashed_samples
             )
@@ -8,6 +8,7 @@ from hub.core.compression import (
     decompress_array,
     compress_multiple,
     decompress_multiple,
+    decompress_batch,
     verify_compressed_file,
     decompress_bytes,
 )
@@ -129,6 +130,21 @@ def test_lz4_bc():
     assert decompressed == inp
 
 
+@pytest.mark.parametrize("compression", ["png", "lz4"])
+def test_decompress_batch(compression):
+    arrays = np.random.randint(0, 255, (4, 16, 16, 3), dtype="uint8")
+    buffers = [compress_array(arr, compression) for arr in arrays]
+    decompressed = decompress_batch(buffers, (16, 16, 3), "uint8", compression)
+    assert decompressed.shape == arrays.shape
+    np.testing.assert_array_equal(decompressed, arrays)
+
+    # backward compatibility with lz4 frames
+    if compression == "lz4":
+        buffers[1] = lz4.frame.compress(arrays[1].tobytes())
+        decompressed = decompress_batch(buffers, (16, 16, 3), "uint8", compression)
+        np.testing.assert_array_equal(decompressed, arrays)
+
+
 @pytest.mark.parametrize("compression", AUDIO_COMPRESSIONS)
 def test_audio(compression, audio_paths):
     path = audio_paths[compression]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from hub.core.quantization import (
+    QUANTIZED_DTYPE,
+    dequantize,
+    format_quantization,
+    get_quantization_error,
+    quantize,
+)
+
+
+@pytest.mark.parametrize("dtype", ["float16", "float32", "float64"])
+def test_quantize_round_trip(dtype):
+    quantization = format_quantization({"scale": 0.02, "zero_point": 100})
+    arr = np.random.uniform(-2, 2.5, (10, 16, 16)).astype(dtype)
+
+    quantized = quantize(arr, quantization)
+    assert quantized.dtype == QUANTIZED_DTYPE
+    assert quantized.shape == arr.shape
+
+    dequantized = dequantize(quantized, quantization, dtype)
+    assert dequantized.dtype == dtype
+    np.testing.assert_allclose(dequantized, arr, atol=0.01 + 1e-3)
+
+    # values outside of the representable range saturate
+    out_of_range = np.array([-100, 100], dtype=dtype)
+    np.testing.assert_array_equal(quantize(out_of_range, quantization), [0, 255])
+
+
+def test_quantization_validation():
+    assert get_quantization_error({"scale": 0.5}, "float32", False) is None
+    assert (
+        get_quantization_error(
+            {"scale": 1, "zero_point": 0, "bits": 8}, "float64", False
+        )
+        is None
+    )
+    assert (
+        get_quantization_error(
+            {"scale": np.float32(0.1), "zero_point": np.uint8(128)}, "float32", False
+        )
+        is None
+    )
+
+    assert get_quantization_error({"scale": 0.5}, "float32", True)
+    assert get_quantization_error({"scale": 0.5}, "uint8", False)
+    assert get_quantization_error({"scale": 0.5}, None, False)
+    assert get_quantization_error({"scale": -1}, "float32", False)
+    assert get_quantization_error({"scale": 1, "zero_point": 256}, "float32", False)
+    assert get_quantization_error({"scale": 1, "bits": 16}, "float32", False)
+    assert get_quantization_error({"scale": 1, "offset": 2}, "float32", False)
+    assert get_quantization_error(0.5, "float32", False)
@@ -161,6 +161,25 @@ def test_single_transform_hub_dataset_htypes(ds, num_workers, scheduler):
     data_in.delete()
 
 
+@hub.compute
+def double_float(sample_in, samples_out):
+    samples_out.x.append(sample_in * 2)
+
+
+@parametrize_num_workers
+def test_quantized_transform(local_ds, num_workers):
+    data_in = list(np.random.uniform(-1, 1.25, (20, 4, 4)).astype("float32"))
+    ds_out = local_ds
+    ds_out.create_tensor(
+        "x", dtype="float32", quantization={"scale": 0.02, "zero_point": 100}
+    )
+    double_float().eval(data_in, ds_out, num_workers=num_workers)
+
+    assert len(ds_out) == 20
+    assert ds_out.x.meta.quantization == {"scale": 0.02, "zero_point": 100, "bits": 8}
+    np.testing.assert_allclose(ds_out.x.numpy(), np.stack(data_in) * 2, atol=0.011)
+
+
 @all_schedulers
 @enabled_non_gcs_datasets
 def test_chain_transform_list_small(ds, scheduler):
@@ -30,6 +30,7 @@ Supported htypes and their respective defaults are:
 """
 
 from typing import Dict
+from hub.constants import HASH_ALGORITHM
 
 DEFAULT_HTYPE = "generic"
 
@@ -57,7 +58,7 @@ HTYPE_CONFIGURATIONS: Dict[str, Dict] = {
         "dtype": "bool"
     },  # TODO: pack numpy arrays to store bools as 1 bit instead of 1 byte
     "segment_mask": {"dtype": "int32"},
-    "hash": {"dtype": "int64"},
+    "hash": {"dtype": "int64", "hash_algorithm": HASH_ALGORITHM},
 }
 
 # these configs are added to every `htype`
@@ -69,6 +70,7 @@ COMMON_CONFIGS: Dict = {
     "linked_tensors": [],
     "is_linked_tensor": None,
     "max_chunk_size": None,
+    "quantization": None,  # ie. {"scale": 0.1, "zero_point": 128}, stores float samples as uint8 (see `hub.core.quantization`)
 }
 
 
@@ -1,8 +1,23 @@
 from typing import Union, Sequence, Any
 from functools import reduce
+from collections import abc
 import numpy as np
 from hub.util.exceptions import TensorDtypeMismatchError
-from hub.core.sample import Sample  # type: ignore
+from hub.core.sample import Sample, SampleValue  # type: ignore
+
+
+def is_sequence(val: Any) -> bool:
+    """Cheaper `isinstance(val, Sequence)`. Lists and tuples are checked by exact type first, since checking against
+    the `Sequence` ABC walks its registry of virtual subclasses."""
+    return isinstance(val, (list, tuple)) or isinstance(val, abc.Sequence)
+
+
+def batch_of_one(sample: SampleValue) -> Union[np.ndarray, Sequence[SampleValue]]:
+    """Wraps a single `sample` into a batch that can be passed to `extend`."""
+    if isinstance(sample, np.ndarray):
+        # a batch of one goes through the uniform numpy path instead of being serialized sample by sample
+        return np.expand_dims(sample, 0)
+    return [sample]
 
 
 def _get_bigger_dtype(d1, d2):
@@ -31,7 +46,7 @@ def get_dtype(val: Union[np.ndarray, Sequence, Sample]) -> np.dtype:
         return np.array("").dtype
     elif isinstance(val, bool):
         return np.bool
-    elif isinstance(val, Sequence):
+    elif is_sequence(val):
         return reduce(_get_bigger_dtype, map(get_dtype, val))
     else:
         raise TypeError(f"Cannot infer numpy dtype for {val}")
@@ -83,7 +98,7 @@ def get_incompatible_dtype(
             if np.can_cast(samples, dtype)
             else getattr(samples, "dtype", np.array(samples).dtype)
         )
-    elif isinstance(samples, Sequence):
+    elif is_sequence(samples):
         return all(map(lambda x: get_incompatible_dtype(x, dtype), samples))
     else:
         raise TypeError(
@@ -2,8 +2,10 @@ from hub.core.tensor import Union, Tensor
 from hub.core.dataset import Dataset
 from hub.client.log import logger
 from hub.util.exceptions import (
+    HashAlgorithmMismatchError,
     HashesTensorDoesNotExistError,
 )
+from hub.util.hash import get_hash_algorithm
 from hub.constants import HASHES_TENSOR_FOLDER
 import os, glob, numpy as np
 
@@ -23,8 +25,10 @@ def jaccard_similarity(list_1, list_2):
     Returns:
         A similarity score that ranges from 0.0 to 1.0. The higher the score, the more similar the lists being compared.
     """
-    intersection = len(list(set(list_1).intersection(list_2)))
-    union = (len(set(list_1)) + len(set(list_2))) - intersection
+    unique_1 = np.unique(list_1)
+    unique_2 = np.unique(list_2)
+    intersection = len(np.intersect1d(unique_1, unique_2, assume_unique=True))
+    union = (len(unique_1) + len(unique_2)) - intersection
     return float(intersection) / union
 
 
@@ -44,6 +48,7 @@ def compare_hashes(dataset_1: Dataset, dataset_2: Dataset) -> int:
 
     Raises:
         HashesTensorDoesNotExistError: If hashes tensor doesn't exist in atleast one of the datasets being compared.
+        HashAlgorithmMismatchError: If the hashes of the datasets were generated with different algorithms.
     """
 
     if (
@@ -52,6 +57,11 @@ def compare_hashes(dataset_1: Dataset, dataset_2: Dataset) -> int:
     ):
         raise HashesTensorDoesNotExistError()
 
+    algorithm_1 = get_hash_algorithm(dataset_1[HASHES_TENSOR_FOLDER].meta)
+    algorithm_2 = get_hash_algorithm(dataset_2[HASHES_TENSOR_FOLDER].meta)
+    if algorithm_1 != algorithm_2:
+        raise HashAlgorithmMismatchError(algorithm_1, algorithm_2)
+
     hashlist_1 = dataset_1[HASHES_TENSOR_FOLDER].numpy()
     hashlist_2 = dataset_2[HASHES_TENSOR_FOLDER].numpy()
 
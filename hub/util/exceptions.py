@@ -371,6 +371,21 @@ class HashesTensorDoesNotExistError(Exception):
         )
 
 
+class HashAlgorithmMismatchError(Exception):
+    def __init__(self, algorithm_1: str, algorithm_2: str):
+        super().__init__(
+            f"Hashes of the datasets being compared were generated with different algorithms ('{algorithm_1}' and"
+            f" '{algorithm_2}'), so they can't be compared."
+        )
+
+
+class UnsupportedHashAlgorithmError(Exception):
+    def __init__(self, algorithm: str, supported: Sequence[str]):
+        super().__init__(
+            f"Hash algorithm '{algorithm}' is not supported. Supported algorithms: {list(supported)}."
+        )
+
+
 class LinkedTensorError(Exception):
     def __init__(self) -> None:
         super().__init__(
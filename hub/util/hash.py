@@ -1,33 +1,74 @@
 import numpy as np
 import mmh3  # type: ignore
+import xxhash  # type: ignore
 from hub.core.sample import Sample, SampleValue  # type: ignore
-from hub.core.serialize import serialize_input_samples
+from hub.core.serialize import serialize_input_samples, byte_view
 from hub.core.meta.tensor_meta import TensorMeta
+from hub.constants import HASH_ALGORITHM, LEGACY_HASH_ALGORITHM
+from hub.util.exceptions import UnsupportedHashAlgorithmError
 
-from typing import List, Sequence, Union
+from typing import Callable, Dict, List, Sequence, Union
 
 
-def generate_hashes(samples: Union[np.ndarray, Sequence[SampleValue]]):
-    """Generates a single 64-bit murmurhash3 for each sample
+def _mmh3_64(buffer: Union[bytes, memoryview]) -> int:
+    # mmh3.hash64 returns two signed 64-bit hashes, the first one is used
+    return mmh3.hash64(bytes(buffer))[0] & 0xFFFFFFFFFFFFFFFF
+
+
+_HASH_FUNCTIONS: Dict[str, Callable[[Union[bytes, memoryview]], int]] = {
+    HASH_ALGORITHM: xxhash.xxh3_64_intdigest,
+    LEGACY_HASH_ALGORITHM: _mmh3_64,
+}
+
+
+def get_hash_algorithm(meta: TensorMeta) -> str:
+    """Returns the algorithm that the hashes in a hashes tensor were generated with."""
+    return getattr(meta, "hash_algorithm", None) or LEGACY_HASH_ALGORITHM
+
+
+def generate_hashes(
+    samples: Union[np.ndarray, Sequence[SampleValue]],
+    algorithm: str = HASH_ALGORITHM,
+) -> np.ndarray:
+    """Generates a single 64-bit hash for each sample
 
     Note:
-        mmh3.hash64 returns two 64-bit hashes. The first one is used in this function.
+        If `samples` is a numpy array, every sample is hashed directly from a single view over the array's
+        buffer instead of being copied with `tobytes` first.
 
     Args:
         samples (Union[np.ndarray, Sequence[SampleValue]): Samples for which hashes are generated.
+        algorithm (str): Hash algorithm to use, should match the hashes tensor's `hash_algorithm`.
+            Either 64-bit xxHash ("xxh3_64") or the first 64 bits of murmurhash3 ("mmh3"). Defaults to "xxh3_64".
 
     Returns:
-        A Python list containg two unsigned 64-bit hashes for each sample in numpy array format
-    """
-    hashlist = []
+        A contiguous int64 numpy array containing a signed 64-bit hash for each sample
 
-    for sample in samples:
+    Raises:
+        UnsupportedHashAlgorithmError: If `algorithm` is not supported.
+    """
+    if algorithm not in _HASH_FUNCTIONS:
+        raise UnsupportedHashAlgorithmError(algorithm, list(_HASH_FUNCTIONS))
+    hash_function = _HASH_FUNCTIONS[algorithm]
 
-        if isinstance(sample, Sample):
-            hashed_sample = mmh3.hash64(sample.uncompressed_bytes())
-        else:
-            hashed_sample = mmh3.hash64(sample.tobytes())
+    num_samples = len(samples)
 
-        hashlist.append(np.array(hashed_sample[0], dtype="int64"))
+    if isinstance(samples, np.ndarray) and num_samples:
+        buffer = byte_view(samples)
+        stride = samples[0].nbytes
+        hashes = (
+            hash_function(buffer[i * stride : (i + 1) * stride])
+            for i in range(num_samples)
+        )
+    else:
+        hashes = (
+            hash_function(
+                sample.uncompressed_bytes()
+                if isinstance(sample, Sample)
+                else byte_view(sample)
+            )
+            for sample in samples
+        )
 
-    return hashlist
+    # Stored in the "hash" htype, which is int64.
+    return np.fromiter(hashes, dtype=np.uint64, count=num_samples).view(np.int64)
@@ -8,13 +8,18 @@ from hub.util.exceptions import (
     TensorDoesNotExistError,
     LinkedTensorError,
     HashesTensorDoesNotExistError,
+    HashAlgorithmMismatchError,
 )
 from hub.tests.common import get_dummy_data_path
 import hub, pytest
 import numpy as np
 from hub.core.tensor import Tensor, _add_missing_meta_attributes
 from hub.tests.common import TENSOR_KEY
-from hub.constants import HASHES_TENSOR_FOLDER
+from hub.constants import (
+    HASHES_TENSOR_FOLDER,
+    HASH_ALGORITHM,
+    LEGACY_HASH_ALGORITHM,
+)
 from hub.tests.dataset_fixtures import enabled_non_gcs_datasets
 
 import glob
@@ -97,6 +102,19 @@ def test_compare_errors(memory_ds, memory_ds_2):
         hub.compare_hashes(memory_ds, memory_ds_2)
 
 
+def test_compare_hash_algorithm_mismatch(memory_ds, memory_ds_2):
+    for ds in (memory_ds, memory_ds_2):
+        ds.create_tensor("image", hash_samples=True)
+        ds.image.append(np.ones((28, 28), dtype=np.uint8))
+
+    assert memory_ds[HASHES_TENSOR_FOLDER].meta.hash_algorithm == HASH_ALGORITHM
+
+    # hashes tensors created before `hash_algorithm` was stored use murmurhash3
+    memory_ds_2[HASHES_TENSOR_FOLDER].meta.hash_algorithm = LEGACY_HASH_ALGORITHM
+    with pytest.raises(HashAlgorithmMismatchError):
+        hub.compare_hashes(memory_ds, memory_ds_2)
+
+
 @enabled_non_gcs_datasets
 def test_linked_tensors(ds):
 
@@ -0,0 +1,32 @@
+import mmh3  # type: ignore
+import numpy as np
+import pytest
+from hub.util.hash import generate_hashes
+from hub.util.exceptions import UnsupportedHashAlgorithmError
+
+
+def test_generate_hashes():
+    arr = np.random.randint(0, 255, size=(10, 28, 28, 3), dtype="uint8")
+
+    hashes = generate_hashes(arr)
+    assert hashes.shape == (10,)
+    assert hashes.dtype == np.int64
+
+    # hashing the batch must match hashing the samples one by one
+    np.testing.assert_array_equal(hashes, generate_hashes(list(arr)))
+    np.testing.assert_array_equal(hashes, generate_hashes(np.asfortranarray(arr)))
+
+    assert len(set(map(int, hashes))) == 10
+    assert generate_hashes([arr[3], arr[3]])[0] == hashes[3]
+
+
+def test_generate_legacy_hashes():
+    arr = np.random.randint(0, 255, size=(5, 28, 28, 3), dtype="uint8")
+
+    # hashes tensors without a `hash_algorithm` hold the first 64-bit murmurhash3 of each sample
+    expected = [mmh3.hash64(sample.tobytes())[0] for sample in arr]
+    np.testing.assert_array_equal(generate_hashes(arr, "mmh3"), expected)
+    np.testing.assert_array_equal(generate_hashes(list(arr), "mmh3"), expected)
+
+    with pytest.raises(UnsupportedHashAlgorithmError):
+        generate_hashes(arr, "md5")